@@ -23,12 +23,84 @@
 #    Licensor: Revolution Semiconductor (Registered in the Netherlands)
 #
 
-from quantiphy import Quantity
+import logging
+
+from deferredImport import deferredModule
+from quantityParser import parseQuantity
+
+logger = logging.getLogger(__name__)
+
+quantiphy = deferredModule("quantiphy")
+np = deferredModule("numpy")
+
+
+def __getattr__(name):
+    # Quantity is re-exported from quantiphy on first access (PEP 562).
+    if name == "Quantity":
+        return quantiphy.Quantity
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def labelArray(labelsDicts: list[dict], key: str):
+    """Parse the given label value of each instance into a float array."""
+    return np.array(
+        [parseQuantity(labels[key].labelValue) for labels in labelsDicts]
+    )
+
+
+def evaluateCallbacks(requests: list[tuple[type, str, dict]]) -> list:
+    """
+    Evaluate callbacks of many instances at once. Each request is a
+    (callback class, method name, labels dict) tuple. Requests are grouped by
+    callback class and method so that classes declaring batch callbacks are
+    evaluated once per group. Results are returned in request order.
+    """
+    groups: dict[tuple[type, str], list[int]] = {}
+    for index, (cls, method, _) in enumerate(requests):
+        groups.setdefault((cls, method), []).append(index)
+    results = [None] * len(requests)
+    for (cls, method), indices in groups.items():
+        values = cls.evaluateBatch(method, [requests[i][2] for i in indices])
+        for index, value in zip(indices, values, strict=True):
+            results[index] = value
+    return results
+
 
 class baseInst():
+    # callback method name -> classmethod evaluating it over a list of
+    # instance labels dicts.
+    batchCallbacks: dict[str, str] = {}
+
     def __init__(self, labels_dict: dict):
         self._labelsDict = labels_dict
 
+    @classmethod
+    def evaluateBatch(cls, method: str, labelsDicts: list[dict]) -> list:
+        """
+        Evaluate a callback for a list of instances. Uses the vectorized
+        batch callback if the class declares one, otherwise or if the batch
+        evaluation fails, each instance is evaluated separately. An instance
+        whose callback fails is logged and gets the '?' placeholder.
+        """
+        batchMethod = cls.batchCallbacks.get(method)
+        if batchMethod is not None:
+            try:
+                return list(getattr(cls, batchMethod)(labelsDicts))
+            except (KeyError, ValueError, ZeroDivisionError) as e:
+                logger.warning(
+                    f"{cls.__name__}.{batchMethod} failed ({e!r}), evaluating "
+                    f"{len(labelsDicts)} instances one by one."
+                )
+        return [cls._evaluateInstance(method, labels) for labels in labelsDicts]
+
+    @classmethod
+    def _evaluateInstance(cls, method: str, labelsDict: dict):
+        try:
+            return getattr(cls(labelsDict), method)()
+        except Exception as e:
+            logger.warning(f"{cls.__name__}.{method} failed: {e!r}")
+            return '?'
+
 class res(baseInst):
     def __init__(self,labels_dict:dict):
         super().__init__(labels_dict)
@@ -36,27 +108,40 @@ class res(baseInst):
     def doubleR(self):
         Rvalue = self._labelsDict.get('R').labelValue
         if Rvalue.isalnum():
-            return str(2*Quantity(Rvalue))
+            return str(2*parseQuantity(Rvalue))
         return '?'
 
 class nmos(baseInst):
+    batchCallbacks = {"asparm": "asparmBatch"}
+    sd1p8v = 0.28
+
     def __init__(self,labels_dict:dict):
         super().__init__(labels_dict)
-        self.w = Quantity(self._labelsDict['@w'].labelValue)
-        self.l = Quantity(self._labelsDict['@l'].labelValue)
-        self.nf= Quantity(self._labelsDict['@nf'].labelValue)
-        self.sd1p8v = 0.28
+        self.w = parseQuantity(self._labelsDict['@w'].labelValue)
+        self.l = parseQuantity(self._labelsDict['@l'].labelValue)
+        self.nf= parseQuantity(self._labelsDict['@nf'].labelValue)
         self.sa1p8v = sb1p8v = 0.265
         self.sourceDiffs = lambda nf: int(int(nf) / 2 + 1)
 
     def asparm(self):
         return self.sourceDiffs(self.nf)*(self.w/self.nf)*self.sd1p8v
 
+    @classmethod
+    def asparmBatch(cls, labelsDicts: list[dict]) -> list[float]:
+        w = labelArray(labelsDicts, '@w')
+        nf = labelArray(labelsDicts, '@nf')
+        if not (np.isfinite(w).all() and np.isfinite(nf).all()):
+            raise ValueError("w and nf must be finite")
+        if not np.all(nf):
+            raise ZeroDivisionError("nf cannot be zero")
+        sourceDiffs = (np.trunc(nf) / 2 + 1).astype(int)
+        return (sourceDiffs * (w / nf) * cls.sd1p8v).tolist()
+
 
 class cap_mim_1f0fF(baseInst):
     def __init__(self, labels_dict:dict):
         super().__init__(labels_dict)
-        self.W = Quantity(self._labelsDict['@W'].labelValue)
-        self.L = Quantity(self._labelsDict['@L'].labelValue)
-        self.m = Quantity(self._labelsDict['@m'].labelValue)
+        self.W = parseQuantity(self._labelsDict['@W'].labelValue)
+        self.L = parseQuantity(self._labelsDict['@L'].labelValue)
+        self.m = parseQuantity(self._labelsDict['@m'].labelValue)
 
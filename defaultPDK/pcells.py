@@ -22,6 +22,15 @@
 #    Licensor: Revolution Semiconductor (Registered in the Netherlands)
 #
 # import pdk.layoutLayers as laylyr
+import hashlib
+import json
+import logging
+import os
+import tempfile
+from collections import OrderedDict
+from pathlib import Path
+
+from deferredImport import deferredModule
 from PySide6.QtCore import (
     QPoint,
 )
@@ -30,6 +39,204 @@ laylyr = importPDKModule('layoutLayers')
 fabproc = importPDKModule('process')
 import revedaEditor.common.layoutShapes as lshp
 
+logger = logging.getLogger(__name__)
+# numpy is only imported when pcell geometry is first evaluated.
+np = deferredModule("numpy")
+
+# changes whenever the pcell code or the database unit changes, so that
+# persisted geometry of older pcell versions is not reused.
+PCELL_VERSION = hashlib.sha1(
+    Path(__file__).read_bytes() + str(fabproc.dbu).encode()
+).hexdigest()[:16]
+
+
+def freezeGeometry(geometry: dict) -> dict:
+    """
+    Convert a {layer name: boxes} dictionary to read-only N x 4 int32 arrays of
+    (x1, y1, x2, y2) boxes in database units.
+    """
+    frozen = {}
+    for layerName, boxes in geometry.items():
+        boxes = np.array(boxes, dtype=np.int32).reshape(-1, 4)
+        boxes.setflags(write=False)
+        frozen[layerName] = boxes
+    return frozen
+
+
+def boundingBox(geometry: dict) -> tuple[int, int, int, int] | None:
+    """
+    Bounding box (x1, y1, x2, y2) of all boxes in a pcell geometry, None if
+    the geometry has no boxes.
+    """
+    boxes = [layerBoxes for layerBoxes in geometry.values() if len(layerBoxes)]
+    if not boxes:
+        return None
+    boxes = np.concatenate(boxes)
+    xs = boxes[:, [0, 2]]
+    ys = boxes[:, [1, 3]]
+    return int(xs.min()), int(ys.min()), int(xs.max()), int(ys.max())
+
+
+def boxPolygons(boxes):
+    """
+    Corner points of N boxes as an N x 4 x 2 array, e.g. to create GDS
+    polygons without going through layout shapes.
+    """
+    x1, y1, x2, y2 = boxes[:, 0], boxes[:, 1], boxes[:, 2], boxes[:, 3]
+    return np.stack(
+        (np.stack((x1, y1), axis=1), np.stack((x2, y1), axis=1),
+         np.stack((x2, y2), axis=1), np.stack((x1, y2), axis=1)),
+        axis=1,
+    )
+
+
+class pcellGeometryCache:
+    """
+    Cache of pcell geometry keyed on (pcell class, pcell version, parameters).
+
+    Geometry is a dictionary of layer name to read-only N x 4 int32 box
+    arrays shared by all instances with the same parameters. Recently used
+    entries are kept in memory up to maxSize. If cacheDir is given, entries
+    are also stored there as JSON files so that they survive between
+    sessions; the least recently used files are removed when there are more
+    than maxDiskEntries of them.
+    """
+
+    def __init__(self, maxSize: int = 512, cacheDir: Path | None = None,
+                 maxDiskEntries: int = 10000):
+        self.maxSize = maxSize
+        self.cacheDir = cacheDir
+        self.maxDiskEntries = maxDiskEntries
+        self._entries: OrderedDict[tuple, dict] = OrderedDict()
+        self._diskEntries: int | None = None
+        self.hits = 0
+        self.diskHits = 0
+        self.misses = 0
+
+    def get(self, key: tuple, compute) -> dict:
+        geometry = self._entries.get(key)
+        if geometry is not None:
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return geometry
+        geometry = self._readDisk(key)
+        if geometry is None:
+            self.misses += 1
+            geometry = freezeGeometry(compute())
+            self._writeDisk(key, geometry)
+        else:
+            self.diskHits += 1
+        self._entries[key] = geometry
+        if len(self._entries) > self.maxSize:
+            self._entries.popitem(last=False)
+        return geometry
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def _diskPath(self, key: tuple) -> Path | None:
+        if self.cacheDir is None:
+            return None
+        return self.cacheDir.joinpath(
+            f"{hashlib.sha1(repr(key).encode()).hexdigest()}.json"
+        )
+
+    def _readDisk(self, key: tuple) -> dict | None:
+        path = self._diskPath(key)
+        if path is None or not path.exists():
+            return None
+        try:
+            with path.open("r") as f:
+                geometry = freezeGeometry(json.load(f))
+            # modification time orders the files for eviction.
+            os.utime(path)
+            return geometry
+        except (OSError, ValueError, TypeError, AttributeError):
+            # unreadable, corrupt or wrongly shaped entries are cache misses.
+            return None
+
+    def _writeDisk(self, key: tuple, geometry: dict) -> None:
+        path = self._diskPath(key)
+        if path is None:
+            return
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            # write to a temporary file first so that other sessions never
+            # read a partially written entry.
+            with tempfile.NamedTemporaryFile(
+                "w", dir=path.parent, suffix=".tmp", delete=False
+            ) as f:
+                json.dump(
+                    {layerName: boxes.tolist() for layerName, boxes in geometry.items()},
+                    f,
+                )
+            os.replace(f.name, path)
+        except OSError:
+            # cache directory is not writable, keep the in-memory cache only.
+            self.cacheDir = None
+            return
+        if self._diskEntries is None:
+            self._diskEntries = sum(1 for _ in path.parent.glob("*.json"))
+        else:
+            self._diskEntries += 1
+        if self._diskEntries > self.maxDiskEntries:
+            self._pruneDisk()
+
+    def _pruneDisk(self) -> None:
+        """Remove the least recently used files down to 90% of the limit."""
+        files = []
+        for path in self.cacheDir.glob("*.json"):
+            try:
+                files.append((path.stat().st_mtime, path))
+            except OSError:
+                pass
+        files.sort()
+        excess = len(files) - int(self.maxDiskEntries * 0.9)
+        for _, path in files[:max(excess, 0)]:
+            try:
+                path.unlink()
+            except OSError:
+                pass
+        self._diskEntries = sum(1 for _ in self.cacheDir.glob("*.json"))
+
+
+def pcellCacheDir() -> Path | None:
+    """
+    Directory of the persistent pcell cache, None to keep pcell geometry in
+    memory only, which is the default. REVEDA_PCELL_CACHE can be set to a
+    directory, to 'user' for a per-user cache directory or to 'pdk' to use a
+    directory in the PDK.
+    """
+    cacheDir = os.environ.get("REVEDA_PCELL_CACHE")
+    if not cacheDir:
+        return None
+    if cacheDir == "pdk":
+        return Path(__file__).parent.joinpath(".pcellCache")
+    if cacheDir == "user":
+        userCache = os.environ.get("XDG_CACHE_HOME") or Path.home().joinpath(".cache")
+        return Path(userCache).joinpath("reveda", "pcellCache")
+    return Path(cacheDir)
+
+
+def envInt(name: str, default: int) -> int:
+    """Integer value of an environment variable, default if unset or invalid."""
+    value = os.environ.get(name)
+    if value is None:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning(f"Invalid {name} value {value!r}, using {default}.")
+        return default
+
+
+geometryCache = pcellGeometryCache(
+    envInt("REVEDA_PCELL_CACHE_SIZE", 512),
+    pcellCacheDir(),
+    envInt("REVEDA_PCELL_DISK_CACHE_SIZE", 10000),
+)
+
+
 class nmos(lshp.layoutPcell):
     cut = int(0.17 * fabproc.dbu)
     poly_to_cut = int(0.055 * fabproc.dbu)
@@ -70,24 +277,42 @@ class nmos(lshp.layoutPcell):
         self.shapes = self.createGeometry()
 
     def createGeometry(self) -> list[lshp.layoutShape]:
-        activeRect = lshp.layoutRect(
-            QPoint(0, 0),
-            QPoint(
-                self._widthPerFinger,
-                int(self._nf * self._drawnLength + 2 * nmos.sa + (self._nf - 1) * nmos.sd),
-            ),
-            laylyr.odLayer_drw,
-        )
-        polyFingers = [lshp.layoutRect(
-            QPoint(-nmos.poly_ovlp_diff,
-            nmos.sa + finger * (self._drawnLength + nmos.sd)),
-            QPoint(self._widthPerFinger + nmos.poly_ovlp_diff,
-            nmos.sa + finger * (self._drawnLength + nmos.sd) + self._drawnLength), laylyr.poLayer_drw,
-        ) for finger in range(self._nf)]
+        return [
+            lshp.layoutRect(QPoint(x1, y1), QPoint(x2, y2), getattr(laylyr, layerName))
+            for layerName, boxes in self.geometry().items()
+            for x1, y1, x2, y2 in boxes.tolist()
+        ]
+
+    def geometry(self) -> dict:
+        """Shared, read-only box arrays of the pcell per layer name."""
+        key = (type(self).__name__, PCELL_VERSION,
+               (int(self._widthPerFinger), self._drawnLength, self._nf))
+        return geometryCache.get(key, self.geometryArrays)
+
+    def geometryArrays(self) -> dict:
+        """
+        Boxes of the pcell per layer name as N x 4 (x1, y1, x2, y2) int32
+        arrays in database units.
+        """
+        widthPerFinger = int(self._widthPerFinger)
+        activeBox = np.array([[
+            0,
+            0,
+            widthPerFinger,
+            int(self._nf * self._drawnLength + 2 * nmos.sa + (self._nf - 1) * nmos.sd),
+        ]], dtype=np.int32)
+        pitch = self._drawnLength + nmos.sd
+        polyY1 = nmos.sa + np.arange(self._nf, dtype=np.int32) * pitch
+        polyFingers = np.column_stack((
+            np.full(self._nf, -nmos.poly_ovlp_diff, dtype=np.int32),
+            polyY1,
+            np.full(self._nf, widthPerFinger + nmos.poly_ovlp_diff, dtype=np.int32),
+            polyY1 + self._drawnLength,
+        )).astype(np.int32, copy=False)
         # contacts = [lshp.layoutRect(
             
         # )]
-        return [activeRect, *polyFingers]
+        return {"odLayer_drw": activeBox, "poLayer_drw": polyFingers}
 
     @property
     def width(self):
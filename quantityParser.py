@@ -0,0 +1,130 @@
+#    “Commons Clause” License Condition v1.0
+#   #
+#    The Software is provided to you by the Licensor under the License, as defined
+#    below, subject to the following condition.
+#
+#    Without limiting other conditions in the License, the grant of rights under the
+#    License will not include, and the License does not grant to you, the right to
+#    Sell the Software.
+#
+#    For purposes of the foregoing, “Sell” means practicing any or all of the rights
+#    granted to you under the License to provide to third parties, for a fee or other
+#    consideration (including without limitation fees for hosting) a product or service whose value
+#    derives, entirely or substantially, from the functionality of the Software. Any
+#    license notice or attribution required by the License must also include this
+#    Commons Clause License Condition notice.
+#
+#    Add-ons and extensions developed for this software may be distributed
+#    under their own separate licenses.
+#
+#    Software: Revolution EDA
+#    License: Mozilla Public License 2.0
+#    Licensor: Revolution Semiconductor (Registered in the Netherlands)
+#
+
+
+"""
+Cached parsing of numbers in engineering notation for Revolution EDA.
+
+parseQuantity returns the value quantiphy would give for a label value such
+as '180n' or '1uF'. Common forms are converted without the general quantiphy
+parser and results are cached per set of quantiphy parsing preferences, so
+that changing the preferences never returns stale values. quantiphy itself is
+imported on the first parse.
+"""
+
+import functools
+import re
+
+from deferredImport import deferredModule
+
+quantiphy = deferredModule("quantiphy")
+
+# exponents of the scale factors quantiphy recognises by default.
+SCALE_FACTORS = {
+    'Q': 'e30', 'R': 'e27', 'Y': 'e24', 'Z': 'e21', 'E': 'e18', 'P': 'e15',
+    'T': 'e12', 'G': 'e9', 'M': 'e6', 'K': 'e3', 'k': 'e3', '_': 'e0',
+    'c': 'e-2', 'm': 'e-3', 'u': 'e-6', 'µ': 'e-6', 'μ': 'e-6', 'n': 'e-9',
+    'p': 'e-12', 'f': 'e-15', 'a': 'e-18', 'z': 'e-21', 'y': 'e-24',
+    'r': 'e-27', 'q': 'e-30',
+}
+_plainNumber = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?", re.ASCII)
+_scaledNumber = re.compile(
+    r"([+-]?(?:\d+\.?\d*|\.\d+))([" + "".join(SCALE_FACTORS) + r"])", re.ASCII
+)
+QUANTITY_CACHE_SIZE = 4096
+# quantiphy preferences that change how a number is parsed.
+PARSING_PREFERENCES = ("input_sf", "known_units", "ignore_sf", "radix", "comma")
+
+
+def quantityPreferences() -> tuple:
+    """Hashable snapshot of the quantiphy preferences used for parsing."""
+    Q = quantiphy.Quantity
+    values = []
+    for name in PARSING_PREFERENCES:
+        value = Q.get_pref(name)
+        if isinstance(value, list):
+            value = tuple(value)
+        values.append(value)
+    return tuple(values)
+
+
+def _defaultPreferences(preferences: tuple) -> bool:
+    inputSf, knownUnits, ignoreSf, radix, comma = preferences
+    return (
+        set(inputSf) == set(SCALE_FACTORS)
+        and not knownUnits
+        and not ignoreSf
+        and radix == "."
+        and comma == ","
+    )
+
+
+def defaultQuantityPreferences() -> bool:
+    """
+    True if the quantiphy preferences that affect number parsing are at
+    their defaults, which the parseQuantity fast path assumes.
+    """
+    return _defaultPreferences(quantityPreferences())
+
+
+@functools.lru_cache(maxsize=QUANTITY_CACHE_SIZE)
+def _parseText(text: str, preferences: tuple) -> float:
+    if _defaultPreferences(preferences):
+        if _plainNumber.fullmatch(text):
+            return float(text)
+        match = _scaledNumber.fullmatch(text)
+        if match:
+            # quantiphy also builds the number from the mantissa and
+            # exponent strings, so results are identical.
+            return float(match.group(1) + SCALE_FACTORS[match.group(2)])
+    return float(quantiphy.Quantity(text))
+
+
+def parseQuantity(text: str) -> float:
+    """
+    Return the value of a number in engineering notation, e.g. '180n' or
+    '1uF', as quantiphy would parse it with its current preferences. Results
+    for strings are cached, values that are not strings are passed to
+    quantiphy as they are.
+    """
+    if not isinstance(text, str):
+        return float(quantiphy.Quantity(text))
+    return _parseText(text, quantityPreferences())
+
+
+def clearQuantityCache() -> None:
+    _parseText.cache_clear()
+
+
+def quantityCacheStats() -> dict:
+    """Hit and miss counts of the quantity parser cache."""
+    info = _parseText.cache_info()
+    lookups = info.hits + info.misses
+    return {
+        "hits": info.hits,
+        "misses": info.misses,
+        "size": info.currsize,
+        "maxSize": info.maxsize,
+        "hitRate": info.hits / lookups if lookups else 0.0,
+    }
@@ -38,20 +38,114 @@
 
 # import time
 import importlib
+import json
 import os
 import pkgutil
 import platform
 import sys
+import time
 from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
 from typing import Optional
 import logging
+
+# profiler should be installed before the heavy imports below.
+import startupProfiler as sprof
+
+profiler = sprof.startupProfiler.fromArgs(sys.argv)
+_importStart = time.perf_counter()
+
 from dotenv import load_dotenv
+from PySide6.QtCore import QEvent, QObject, QTimer
+from PySide6.QtGui import QAction
 from PySide6.QtWidgets import QApplication
 
 import revedaEditor.gui.pythonConsole as pcon
 import revedaEditor.gui.revedaMain as rvm
 
+profiler.markPhase("imports", _importStart)
+
+
+class revedaPlugin:
+    """
+    Lazy handle for a plugin described by a manifest file.
+
+    The plugin module is imported only when one of its menu actions is
+    triggered or one of its attributes is accessed. A manifest is a JSON file,
+    ``plugin.json`` inside a plugin package or ``<name>.json`` next to a single
+    module plugin, with the following keys:
+
+        name: display name of the plugin.
+        entryPoint: module to import, defaults to the plugin module name.
+        menus: list of {"menu": ..., "text": ..., "callback": ...} entries. The
+            callback is a function in the entry point module called with the
+            main window.
+        activation: list of triggers, "onAction" (default) or "onStartup".
+    """
+
+    def __init__(self, name: str, manifest: dict, logger: logging.Logger):
+        self.name = manifest.get("name", name)
+        self.entryPoint = manifest.get("entryPoint", name)
+        self.menus = manifest.get("menus", [])
+        self.activation = manifest.get("activation", ["onAction"])
+        self.logger = logger
+        self._module = None
+
+    @property
+    def loaded(self) -> bool:
+        return self._module is not None
+
+    def load(self):
+        if self._module is None:
+            start = time.perf_counter()
+            try:
+                self._module = importlib.import_module(self.entryPoint)
+            except Exception as e:
+                self.logger.error(
+                    f"Failed to import plugin {self.name} after "
+                    f"{(time.perf_counter() - start) * 1000:.1f} ms: {e}"
+                )
+                raise
+            self.logger.info(
+                f"Imported plugin {self.name} in "
+                f"{(time.perf_counter() - start) * 1000:.1f} ms"
+            )
+        return self._module
+
+    def invoke(self, callback: str, *args):
+        """
+        Call a function of the plugin module. Errors are logged instead of
+        being raised as this is called from menu action slots.
+        """
+        try:
+            return getattr(self.load(), callback)(*args)
+        except Exception as e:
+            self.logger.error(f"Plugin {self.name} callback {callback} failed: {e}")
+            return None
+
+    def __getattr__(self, attr):
+        # only called for attributes not found on the handle itself.
+        module = self.__dict__.get("_module")
+        if attr.startswith("__"):
+            # do not import the plugin for dunder lookups, e.g. by copy or
+            # pickle, but forward them once the module is loaded.
+            if module is None:
+                raise AttributeError(attr)
+            return getattr(module, attr)
+        try:
+            module = self.load()
+        except Exception as e:
+            # keep hasattr() and getattr() with a default working for
+            # plugins that fail to import; the failure is already logged.
+            raise AttributeError(
+                f"plugin {self.name} could not be loaded: {e}"
+            ) from e
+        return getattr(module, attr)
+
+    def __repr__(self):
+        state = "loaded" if self.loaded else "deferred"
+        return f"revedaPlugin({self.name}, {state})"
+
 
 class revedaApp(QApplication):
     """
@@ -67,33 +161,114 @@ class revedaApp(QApplication):
         super().__init__(*args, **kwargs)
         
         # Load environment variables and setup paths
-        load_dotenv()
+        with profiler.phase("dotenv"):
+            load_dotenv()
         reveda_runpathObj = Path(__file__).resolve().parent
         
         # Initialize logger
-        self.logger = logging.Logger(self.LOGGER)
-        f_handler = logging.FileHandler("reveda.log")
-        f_handler.setLevel(logging.INFO)
-        f_format = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
-        f_handler.setFormatter(f_format)
-        self.logger.addHandler(f_handler)
+        with profiler.phase("logger"):
+            self.logger = logging.Logger(self.LOGGER)
+            f_handler = logging.FileHandler("reveda.log")
+            f_handler.setLevel(logging.INFO)
+            f_format = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+            f_handler.setFormatter(f_format)
+            self.logger.addHandler(f_handler)
         # Setup paths and plugins
-        self.setPaths(reveda_runpathObj)
+        with profiler.phase("setPaths"):
+            self.setPaths(reveda_runpathObj)
         self.plugins = {}
         
         # Plugin setup
-        plugin_dir = reveda_runpathObj / "plugins"
-        if plugin_dir not in sys.path:
-            sys.path.insert(0, str(plugin_dir))
-        self.discover_plugins(plugin_dir)
+        with profiler.phase("pluginDiscovery"):
+            plugin_dir = reveda_runpathObj / "plugins"
+            if plugin_dir not in sys.path:
+                sys.path.insert(0, str(plugin_dir))
+            self.discover_plugins(plugin_dir)
         
         # Log loaded plugins
         self.logger.info(f"Loaded plugins: {self.plugins}")
 
     def discover_plugins(self, plugin_dir):
         for finder, name, ispkg in pkgutil.iter_modules([plugin_dir]):
-            module = importlib.import_module(name)
-            self.plugins[f'{plugin_dir.name}.{name}'] = module
+            manifest = self._readManifest(plugin_dir, name, ispkg)
+            if manifest is None:
+                # plugins without a manifest are imported eagerly as before.
+                plugin = revedaPlugin(name, {}, self.logger)
+                plugin.load()
+            else:
+                plugin = revedaPlugin(name, manifest, self.logger)
+                if "onStartup" in plugin.activation:
+                    plugin.load()
+            self.plugins[f'{plugin_dir.name}.{name}'] = plugin
+
+    def _readManifest(self, pluginDir: Path, name: str, ispkg: bool) -> dict | None:
+        """Read the plugin manifest without importing the plugin."""
+        if ispkg:
+            manifestPath = Path(pluginDir, name, "plugin.json")
+        else:
+            manifestPath = Path(pluginDir, f"{name}.json")
+        if not manifestPath.exists():
+            return None
+        try:
+            with manifestPath.open("r") as f:
+                manifest = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            self.logger.error(f"Invalid plugin manifest {manifestPath}: {e}")
+            return None
+        if not isinstance(manifest, dict):
+            self.logger.error(f"Invalid plugin manifest {manifestPath}: not an object")
+            return None
+        for key in ("name", "entryPoint"):
+            if key in manifest and not isinstance(manifest[key], str):
+                self.logger.error(f"Invalid {key} in plugin manifest {manifestPath}")
+                del manifest[key]
+        activation = manifest.get("activation", ["onAction"])
+        if isinstance(activation, str):
+            activation = [activation]
+        if not isinstance(activation, list):
+            self.logger.error(f"Invalid activation in plugin manifest {manifestPath}")
+            activation = ["onAction"]
+        manifest["activation"] = activation
+        menus = manifest.get("menus", [])
+        if not isinstance(menus, list):
+            self.logger.error(f"Invalid menus in plugin manifest {manifestPath}")
+            menus = []
+        manifest["menus"] = []
+        for entry in menus:
+            if isinstance(entry, dict) and isinstance(entry.get("callback"), str):
+                manifest["menus"].append(entry)
+            else:
+                self.logger.error(
+                    f"Skipping invalid menu entry {entry!r} in plugin manifest "
+                    f"{manifestPath}"
+                )
+        return manifest
+
+    def registerPluginMenus(self, mainW) -> None:
+        """
+        Add menu items declared in plugin manifests to the main window menu bar.
+        Plugin modules are imported when their action is first triggered.
+        """
+        menuBar = mainW.menuBar()
+        menus = {
+            action.text().replace("&", ""): action.menu()
+            for action in menuBar.actions()
+            if action.menu() is not None
+        }
+        for plugin in self.plugins.values():
+            for entry in plugin.menus:
+                callback = entry["callback"]
+                menuName = entry.get("menu", plugin.name)
+                menu = menus.get(menuName)
+                if menu is None:
+                    menu = menuBar.addMenu(menuName)
+                    menus[menuName] = menu
+                action = QAction(entry.get("text", plugin.name), mainW)
+                action.triggered.connect(
+                    lambda checked=False, plugin=plugin, callback=callback:
+                    plugin.invoke(callback, mainW)
+                )
+                menu.addAction(action)
 
     def _resolve_path(self, env_path: str | None, base_path: Path, env_var_name: str) -> Path | None:
         """Helper method to resolve and validate a path from environment variable."""
@@ -131,6 +306,22 @@ class revedaApp(QApplication):
             sys.path.append(str(self.revedaPdkPathObj))
 
 
+class firstPaintWatcher(QObject):
+    """Calls the given function once the watched widget is first painted."""
+
+    def __init__(self, widget, callback):
+        super().__init__(widget)
+        self._callback = callback
+        widget.installEventFilter(self)
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Type.Paint:
+            watched.removeEventFilter(self)
+            # let the paint event finish before reporting.
+            QTimer.singleShot(0, self._callback)
+        return False
+
+
 def initialize_app(argv) -> tuple[revedaApp, Optional[str]]:
     """Initialize application and determine style"""
     OS_STYLE_MAP = {"Windows": "Fusion", "Linux": "Fusion", "Darwin": "macOS"}
@@ -140,16 +331,32 @@ def initialize_app(argv) -> tuple[revedaApp, Optional[str]]:
 
 
 
+def writeStartupProfile(app: revedaApp, paintStart: float) -> None:
+    profiler.markPhase("firstPaint", paintStart)
+    report = profiler.writeReport(app.revedaPdkPathObj)
+    app.logger.info(
+        f"Start-up profile written to {profiler.reportPath}: {report['totalMs']} ms"
+    )
+
+
 def main():
-    app, style = initialize_app(sys.argv)
+    with profiler.phase("initializeApp"):
+        app, style = initialize_app(sys.argv)
     if style:
         app.setStyle(style)
         print(f"Applied {style} style")
-    mainW = rvm.MainWindow()
-    mainW.setWindowTitle("Revolution EDA")
-    app.mainW = mainW
+    with profiler.phase("mainWindow"):
+        mainW = rvm.MainWindow()
+        mainW.setWindowTitle("Revolution EDA")
+        app.mainW = mainW
+        app.registerPluginMenus(mainW)
     console = mainW.centralW.console
     redirect = pcon.Redirect(console.errorwrite)
+    if profiler.enabled:
+        paintStart = time.perf_counter()
+        app.paintWatcher = firstPaintWatcher(
+            mainW, lambda: writeStartupProfile(app, paintStart)
+        )
     with redirect_stdout(console), redirect_stderr(redirect):
         mainW.show()
         return app.exec()
@@ -0,0 +1,240 @@
+#    “Commons Clause” License Condition v1.0
+#   #
+#    The Software is provided to you by the Licensor under the License, as defined
+#    below, subject to the following condition.
+#
+#    Without limiting other conditions in the License, the grant of rights under the
+#    License will not include, and the License does not grant to you, the right to
+#    Sell the Software.
+#
+#    For purposes of the foregoing, “Sell” means practicing any or all of the rights
+#    granted to you under the License to provide to third parties, for a fee or other
+#    consideration (including without limitation fees for hosting) a product or service whose value
+#    derives, entirely or substantially, from the functionality of the Software. Any
+#    license notice or attribution required by the License must also include this
+#    Commons Clause License Condition notice.
+#
+#    Add-ons and extensions developed for this software may be distributed
+#    under their own separate licenses.
+#
+#    Software: Revolution EDA
+#    License: Mozilla Public License 2.0
+#    Licensor: Revolution Semiconductor (Registered in the Netherlands)
+#
+
+"""
+Start-up profiling for Revolution EDA.
+
+Enabled with ``reveda --profile-startup`` or by setting the
+``REVEDA_PROFILE_STARTUP`` environment variable. The profiler records the wall
+time of each start-up phase and the time spent importing every module and
+writes them as a JSON report. Only the standard library is used here so that
+the profiler can be installed before any heavy import takes place.
+"""
+
+import importlib.abc
+import json
+import os
+import platform
+import sys
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+
+PROFILE_FLAG = "--profile-startup"
+PROFILE_ENV = "REVEDA_PROFILE_STARTUP"
+REPORT_FILE = "reveda_startup_profile.json"
+TOP_IMPORTS = 25
+# environment values that leave profiling disabled
+OFF_VALUES = ("", "0", "false", "no", "off")
+
+
+class timedLoader(importlib.abc.Loader):
+    """
+    Wraps the loader of a module spec and reports the time spent executing
+    the module to the profiler. The original loader is put back on the
+    module before its code runs, so the module never sees the wrapper.
+    """
+
+    def __init__(self, loader, profiler: "startupProfiler"):
+        self._loader = loader
+        self._profiler = profiler
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        module.__loader__ = self._loader
+        if module.__spec__ is not None:
+            module.__spec__.loader = self._loader
+        with self._profiler.timeImport(module.__name__):
+            self._loader.exec_module(module)
+
+    def __getattr__(self, attr):
+        return getattr(self._loader, attr)
+
+
+class importTimingFinder(importlib.abc.MetaPathFinder):
+    """
+    Meta path finder that delegates to the other finders and wraps the
+    loaders they return. Unlike an __import__ hook, it also sees modules
+    loaded through importlib.import_module and submodules loaded by
+    ``from package import submodule``.
+    """
+
+    def __init__(self, profiler: "startupProfiler"):
+        self._profiler = profiler
+
+    def find_spec(self, name, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec is not None:
+                if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                    spec.loader = timedLoader(spec.loader, self._profiler)
+                return spec
+        return None
+
+
+class startupProfiler:
+    """
+    Records start-up phases and module import times.
+
+    When disabled, all methods are no-ops so that the instrumentation can stay
+    in the start-up code permanently.
+    """
+
+    def __init__(self, enabled: bool = False, reportPath: str = REPORT_FILE,
+                 topImports: int = TOP_IMPORTS):
+        self.enabled = enabled
+        self.reportPath = Path(reportPath)
+        self.topImports = topImports
+        self.phases: list[tuple[str, float]] = []
+        # module name -> [cumulative seconds, self seconds]
+        self.imports: dict[str, list[float]] = {}
+        self._importStack: list[list[float]] = []
+        self._finder = None
+        self._start = time.perf_counter()
+
+    @classmethod
+    def fromArgs(cls, argv: list[str]) -> "startupProfiler":
+        """
+        Create a profiler from the command line and the environment. The
+        profiling flag is removed from argv. The environment variable may be
+        set to the path of the report file; 0, false, no and off disable it.
+        """
+        enabled = PROFILE_FLAG in argv
+        if enabled:
+            argv.remove(PROFILE_FLAG)
+        envValue = os.environ.get(PROFILE_ENV, "").strip()
+        reportPath = REPORT_FILE
+        if envValue.lower() not in OFF_VALUES:
+            enabled = True
+            if envValue.endswith(".json"):
+                reportPath = envValue
+        try:
+            topImports = int(os.environ.get("REVEDA_PROFILE_TOP", TOP_IMPORTS))
+        except ValueError:
+            topImports = TOP_IMPORTS
+        profiler = cls(enabled, reportPath, topImports)
+        if enabled:
+            profiler.installImportHook()
+        return profiler
+
+    def installImportHook(self) -> None:
+        if self._finder is None:
+            self._finder = importTimingFinder(self)
+            sys.meta_path.insert(0, self._finder)
+
+    def removeImportHook(self) -> None:
+        if self._finder is not None:
+            if self._finder in sys.meta_path:
+                sys.meta_path.remove(self._finder)
+            self._finder = None
+
+    @contextmanager
+    def timeImport(self, moduleName: str):
+        """Record the cumulative and self time of executing a module."""
+        # children accumulate their cumulative time in the frame of the parent.
+        frame = [0.0]
+        self._importStack.append(frame)
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self._importStack.pop()
+            if self._importStack:
+                self._importStack[-1][0] += elapsed
+            record = self.imports.setdefault(moduleName, [0.0, 0.0])
+            record[0] += elapsed
+            record[1] += elapsed - frame[0]
+
+    def phase(self, name: str):
+        """Context manager measuring the wall time of a start-up phase."""
+        if not self.enabled:
+            return nullcontext()
+        return self._phase(name)
+
+    @contextmanager
+    def _phase(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.phases.append((name, time.perf_counter() - start))
+
+    def markPhase(self, name: str, start: float) -> None:
+        """Record a phase that started at the given perf_counter value."""
+        if self.enabled:
+            self.phases.append((name, time.perf_counter() - start))
+
+    def modulesUnder(self, path: Path | None) -> list[str]:
+        """Names of the profiled modules loaded from below the given path."""
+        if path is None:
+            return []
+        root = Path(path).resolve()
+        names = []
+        for name in self.imports:
+            moduleFile = getattr(sys.modules.get(name), "__file__", None)
+            if moduleFile and Path(moduleFile).resolve().is_relative_to(root):
+                names.append(name)
+        return names
+
+    def report(self, pdkPath: Path | None = None) -> dict:
+        slowest = sorted(self.imports.items(), key=lambda item: item[1][1],
+                         reverse=True)[: self.topImports]
+        pdkModules = self.modulesUnder(pdkPath)
+        return {
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "totalMs": round((time.perf_counter() - self._start) * 1000, 3),
+            "phases": [
+                {"name": name, "ms": round(elapsed * 1000, 3)}
+                for name, elapsed in self.phases
+            ],
+            "pdkImportMs": round(
+                sum(self.imports[name][1] for name in pdkModules) * 1000, 3
+            ),
+            "importCount": len(self.imports),
+            "slowestImports": [
+                {
+                    "module": name,
+                    "selfMs": round(selfTime * 1000, 3),
+                    "cumulativeMs": round(cumulative * 1000, 3),
+                }
+                for name, (cumulative, selfTime) in slowest
+            ],
+        }
+
+    def writeReport(self, pdkPath: Path | None = None) -> dict | None:
+        """Stop recording imports and write the JSON report."""
+        if not self.enabled:
+            return None
+        self.removeImportHook()
+        report = self.report(pdkPath)
+        with self.reportPath.open("w") as f:
+            json.dump(report, f, indent=4)
+        return report
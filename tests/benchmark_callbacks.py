@@ -0,0 +1,49 @@
+"""
+Benchmark of the import time of the PDK callbacks module.
+
+Each import is timed in a fresh interpreter so that modules cached by an
+earlier run do not hide the cost. Compares importing defaultPDK.callbacks,
+which defers quantiphy until the first quantity is parsed, with importing it
+together with quantiphy as the module did before. Run from the repository
+root:
+
+    python tests/benchmark_callbacks.py [repeats]
+"""
+
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).parent.parent
+
+CASES = {
+    "lazy quantiphy": "import defaultPDK.callbacks",
+    "eager quantiphy": "import quantiphy, defaultPDK.callbacks",
+}
+
+
+def timeImport(statement: str) -> float:
+    """Import time of the statement in a fresh interpreter, in ms."""
+    code = (
+        "import time; start = time.perf_counter(); "
+        f"{statement}; print(time.perf_counter() - start)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=REPO_ROOT, capture_output=True,
+        text=True, check=True,
+    )
+    return float(result.stdout) * 1000
+
+
+def main(repeats: int = 20) -> None:
+    print(f"{'case':<20}{'median ms':>12}{'min ms':>12}")
+    for caseName, statement in CASES.items():
+        times = [timeImport(statement) for _ in range(repeats)]
+        print(
+            f"{caseName:<20}{statistics.median(times):>12.2f}{min(times):>12.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 20)
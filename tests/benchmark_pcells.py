@@ -0,0 +1,92 @@
+"""
+Benchmark of the pcell geometry backends.
+
+Compares the NumPy box generation of nmos.geometryArrays with the per-finger
+Python loop it replaced, for 100-finger devices and for large arrays of
+devices, and the in-memory geometry cache with reads from the optional disk
+cache. Run from the repository root with the PDK set up:
+
+    python tests/benchmark_pcells.py [repeats]
+"""
+
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+from defaultPDK import pcells
+
+
+def loopGeometry(device: pcells.nmos) -> dict:
+    """Per-finger Python implementation used before the NumPy backend."""
+    widthPerFinger = int(device._widthPerFinger)
+    activeBox = [(
+        0,
+        0,
+        widthPerFinger,
+        int(device._nf * device._drawnLength + 2 * pcells.nmos.sa
+            + (device._nf - 1) * pcells.nmos.sd),
+    )]
+    polyFingers = [(
+        -pcells.nmos.poly_ovlp_diff,
+        pcells.nmos.sa + finger * (device._drawnLength + pcells.nmos.sd),
+        widthPerFinger + pcells.nmos.poly_ovlp_diff,
+        pcells.nmos.sa + finger * (device._drawnLength + pcells.nmos.sd)
+        + device._drawnLength,
+    ) for finger in range(device._nf)]
+    return {"odLayer_drw": activeBox, "poLayer_drw": polyFingers}
+
+
+def cachedGeometry(cache: pcells.pcellGeometryCache):
+    """Geometry of a device looked up in the given cache."""
+    def geometry(device: pcells.nmos) -> dict:
+        previous, pcells.geometryCache = pcells.geometryCache, cache
+        try:
+            return device.geometry()
+        finally:
+            pcells.geometryCache = previous
+    return geometry
+
+
+def timeGeometry(function, devices: list, repeats: int) -> tuple[float, int]:
+    boxes = 0
+    start = time.perf_counter()
+    for _ in range(repeats):
+        for device in devices:
+            boxes += sum(len(layerBoxes) for layerBoxes in function(device).values())
+    return time.perf_counter() - start, boxes
+
+
+def main(repeats: int = 5) -> None:
+    memoryCache = pcells.pcellGeometryCache(maxSize=2048)
+    # without in-memory entries every lookup after the first reads the
+    # disk cache, which lives in a temporary directory.
+    diskDir = tempfile.TemporaryDirectory()
+    diskCache = pcells.pcellGeometryCache(maxSize=0, cacheDir=Path(diskDir.name))
+    cases = {
+        "1 x 100 fingers": [pcells.nmos(width=50.0, length=0.13, nf=100)],
+        "1 x 10000 fingers": [pcells.nmos(width=5000.0, length=0.13, nf=10000)],
+        "1000 x 100 fingers": [
+            pcells.nmos(width=50.0 + index * 0.01, length=0.13, nf=100)
+            for index in range(1000)
+        ],
+    }
+    backends = {
+        "python loop": loopGeometry,
+        "numpy": lambda device: device.geometryArrays(),
+        "numpy, cached": cachedGeometry(memoryCache),
+        "numpy, disk": cachedGeometry(diskCache),
+    }
+    print(f"{'case':<20}{'backend':<16}{'ms':>10}{'boxes/s':>16}")
+    for caseName, devices in cases.items():
+        for backendName, function in backends.items():
+            elapsed, boxes = timeGeometry(function, devices, repeats)
+            print(
+                f"{caseName:<20}{backendName:<16}{elapsed * 1000:>10.1f}"
+                f"{boxes / elapsed:>16,.0f}"
+            )
+    diskDir.cleanup()
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 5)
@@ -0,0 +1,112 @@
+import logging
+import subprocess
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+from defaultPDK import callbacks
+
+
+def labels(**values):
+    return {key: SimpleNamespace(labelValue=value) for key, value in values.items()}
+
+
+def test_callbacks_import_does_not_import_quantiphy():
+    code = (
+        "import sys, defaultPDK.callbacks; "
+        "sys.exit('quantiphy' in sys.modules)"
+    )
+    repoRoot = Path(__file__).parent.parent
+    assert subprocess.run([sys.executable, "-c", code], cwd=repoRoot).returncode == 0
+
+
+def test_res_doubleR():
+    assert callbacks.res({"R": SimpleNamespace(labelValue="1k")}).doubleR() == "2000.0"
+
+
+def test_nmos_asparm():
+    inst = callbacks.nmos(labels(**{"@w": "4u", "@l": "180n", "@nf": "2"}))
+    assert inst.asparm() == pytest.approx(2 * 2e-6 * 0.28)
+
+
+def test_nmos_asparm_batch_matches_instances():
+    values = [("4u", "180n", "2"), ("1u", "130n", "1"), ("10u", "1u", "5")]
+    labelsDicts = [labels(**{"@w": w, "@l": l, "@nf": nf}) for w, l, nf in values]
+    expected = [callbacks.nmos(item).asparm() for item in labelsDicts]
+    assert callbacks.nmos.evaluateBatch("asparm", labelsDicts) == expected
+
+
+def test_evaluateCallbacks_groups_and_keeps_order():
+    requests = [
+        (callbacks.nmos, "asparm", labels(**{"@w": "4u", "@l": "1u", "@nf": "2"})),
+        (callbacks.res, "doubleR", {"R": SimpleNamespace(labelValue="1k")}),
+        (callbacks.nmos, "asparm", labels(**{"@w": "2u", "@l": "1u", "@nf": "1"})),
+    ]
+    results = callbacks.evaluateCallbacks(requests)
+    assert results[1] == "2000.0"
+    assert results[0] == pytest.approx(2 * 2e-6 * 0.28)
+    assert results[2] == pytest.approx(1 * 2e-6 * 0.28)
+
+
+class failingBatch(callbacks.baseInst):
+    batchCallbacks = {"value": "valueBatch"}
+
+    def value(self):
+        return self._labelsDict["x"].labelValue * 2
+
+    @classmethod
+    def valueBatch(cls, labelsDicts):
+        raise ValueError("batch failed")
+
+
+def test_batch_falls_back_to_instances(caplog):
+    labelsDicts = [labels(x="a"), labels(x="b")]
+    with caplog.at_level(logging.WARNING, logger=callbacks.logger.name):
+        assert failingBatch.evaluateBatch("value", labelsDicts) == ["aa", "bb"]
+    assert "failingBatch.valueBatch failed" in caplog.text
+
+
+@pytest.mark.parametrize("nf", ["inf", "nan"])
+def test_asparm_batch_non_finite_falls_back(caplog, nf):
+    labelsDicts = [
+        labels(**{"@w": "4u", "@l": "180n", "@nf": "2"}),
+        labels(**{"@w": "4u", "@l": "180n", "@nf": nf}),
+    ]
+    with caplog.at_level(logging.WARNING, logger=callbacks.logger.name):
+        results = callbacks.nmos.evaluateBatch("asparm", labelsDicts)
+    assert "nmos.asparmBatch failed" in caplog.text
+    assert results == [pytest.approx(2 * 2e-6 * 0.28), "?"]
+
+
+def test_failing_instance_does_not_abort_other_groups(caplog):
+    requests = [
+        (callbacks.nmos, "asparm", labels(**{"@w": "4u", "@l": "1u", "@nf": "0"})),
+        (callbacks.res, "doubleR", {"R": SimpleNamespace(labelValue="1k")}),
+        (callbacks.nmos, "asparm", labels(**{"@w": "2u", "@l": "1u", "@nf": "1"})),
+    ]
+    with caplog.at_level(logging.WARNING, logger=callbacks.logger.name):
+        results = callbacks.evaluateCallbacks(requests)
+    assert results == ["?", "2000.0", pytest.approx(1 * 2e-6 * 0.28)]
+    assert "nmos.asparm failed" in caplog.text
+
+
+class shortBatch(callbacks.baseInst):
+    batchCallbacks = {"value": "valueBatch"}
+
+    @classmethod
+    def valueBatch(cls, labelsDicts):
+        return [1]
+
+
+def test_evaluateCallbacks_rejects_wrong_batch_length():
+    requests = [(shortBatch, "value", labels(x="a")), (shortBatch, "value", labels(x="b"))]
+    with pytest.raises(ValueError):
+        callbacks.evaluateCallbacks(requests)
+
+
+def test_Quantity_is_reexported_class():
+    from quantiphy import Quantity
+
+    assert callbacks.Quantity is Quantity
+    assert isinstance(Quantity("1u"), callbacks.Quantity)
@@ -0,0 +1,114 @@
+import numpy as np
+import pytest
+from defaultPDK import pcells
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return pcells.pcellGeometryCache(maxSize=2, cacheDir=tmp_path)
+
+
+def test_geometry_computed_once_per_key(cache):
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"odLayer_drw": [[0, 0, 10, 20]]}
+
+    first = cache.get(("nmos", "v", (10, 20, 1)), compute)
+    second = cache.get(("nmos", "v", (10, 20, 1)), compute)
+    assert first is second
+    assert first["odLayer_drw"].tolist() == [[0, 0, 10, 20]]
+    assert not first["odLayer_drw"].flags.writeable
+    assert len(calls) == 1
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_geometry_lru_eviction_and_disk_tier(cache):
+    for nf in range(3):
+        cache.get(("nmos", "v", (10, 20, nf)), lambda: {"odLayer_drw": [[0, 0, nf, 1]]})
+    assert ("nmos", "v", (10, 20, 0)) not in cache._entries
+    geometry = cache.get(("nmos", "v", (10, 20, 0)), lambda: pytest.fail("recomputed"))
+    assert geometry["odLayer_drw"].dtype == np.int32
+    assert geometry["odLayer_drw"].tolist() == [[0, 0, 0, 1]]
+    assert cache.diskHits == 1
+
+
+def test_disk_tier_is_bounded_and_atomic(tmp_path):
+    cache = pcells.pcellGeometryCache(maxSize=2, cacheDir=tmp_path, maxDiskEntries=10)
+    for nf in range(25):
+        cache.get(("nmos", "v", (10, 20, nf)), lambda: {"odLayer_drw": [[0, 0, nf, 1]]})
+    assert len(list(tmp_path.glob("*.json"))) <= 10
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_pcellCacheDir(monkeypatch, tmp_path):
+    monkeypatch.delenv("REVEDA_PCELL_CACHE", raising=False)
+    assert pcells.pcellCacheDir() is None
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+    monkeypatch.setenv("REVEDA_PCELL_CACHE", "user")
+    assert pcells.pcellCacheDir() == tmp_path.joinpath("reveda", "pcellCache")
+    monkeypatch.setenv("REVEDA_PCELL_CACHE", "pdk")
+    assert pcells.pcellCacheDir().parent.name == "defaultPDK"
+    monkeypatch.setenv("REVEDA_PCELL_CACHE", str(tmp_path))
+    assert pcells.pcellCacheDir() == tmp_path
+
+
+def test_envInt_falls_back_on_invalid_values(monkeypatch, caplog):
+    monkeypatch.setenv("REVEDA_PCELL_CACHE_SIZE", "lots")
+    assert pcells.envInt("REVEDA_PCELL_CACHE_SIZE", 512) == 512
+    assert "Invalid REVEDA_PCELL_CACHE_SIZE" in caplog.text
+    monkeypatch.setenv("REVEDA_PCELL_CACHE_SIZE", "64")
+    assert pcells.envInt("REVEDA_PCELL_CACHE_SIZE", 512) == 64
+
+
+@pytest.mark.parametrize("content", ["[1, 2]", '{"odLayer_drw": null}', '{"odLayer_drw": [[1, 2, 3]]}'])
+def test_wrongly_shaped_disk_entry_is_a_miss(tmp_path, content):
+    cache = pcells.pcellGeometryCache(cacheDir=tmp_path)
+    cache._diskPath(("key",)).write_text(content)
+    geometry = cache.get(("key",), lambda: {"odLayer_drw": [(0, 0, 1, 1)]})
+    assert cache.misses == 1
+    assert geometry["odLayer_drw"].tolist() == [[0, 0, 1, 1]]
+
+
+def test_nmos_instances_share_geometry(qtbot, monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        pcells, "geometryCache", pcells.pcellGeometryCache(cacheDir=tmp_path)
+    )
+    device1 = pcells.nmos()
+    device2 = pcells.nmos()
+    device1(4.0, 0.13, 2)
+    hits = pcells.geometryCache.hits
+    device2(4.0, 0.13, 2)
+    assert pcells.geometryCache.misses == 1
+    assert pcells.geometryCache.hits == hits + 1
+    assert len(device1.shapes) == len(device2.shapes) == 3
+
+
+@pytest.mark.parametrize("nf", [1, 100, 10000])
+def test_nmos_finger_arrays(nf):
+    device = pcells.nmos(width=0.5 * nf, length=0.13, nf=nf)
+    geometry = device.geometryArrays()
+    assert all(boxes.dtype == np.int32 for boxes in geometry.values())
+    poly = geometry["poLayer_drw"]
+    assert poly.shape == (nf, 4)
+    pitch = device._drawnLength + pcells.nmos.sd
+    assert np.all(np.diff(poly[:, 1]) == pitch)
+    assert np.all(poly[:, 3] - poly[:, 1] == device._drawnLength)
+    x1, y1, x2, y2 = pcells.boundingBox(pcells.freezeGeometry(geometry))
+    assert (x1, x2) == (-pcells.nmos.poly_ovlp_diff, 500 + pcells.nmos.poly_ovlp_diff)
+    assert pcells.boxPolygons(poly).shape == (nf, 4, 2)
+
+
+def test_nmos_arrays_match_finger_loop():
+    from benchmark_pcells import loopGeometry
+
+    device = pcells.nmos(width=50.0, length=0.13, nf=100)
+    arrays = device.geometryArrays()
+    for layerName, boxes in loopGeometry(device).items():
+        assert arrays[layerName].tolist() == [list(box) for box in boxes]
+
+
+def test_boundingBox_of_empty_geometry():
+    assert pcells.boundingBox({}) is None
+    assert pcells.boundingBox(pcells.freezeGeometry({"odLayer_drw": []})) is None
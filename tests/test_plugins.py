@@ -0,0 +1,114 @@
+import json
+import logging
+import sys
+from types import SimpleNamespace
+
+import pytest
+from reveda import revedaApp, revedaPlugin
+
+
+@pytest.fixture
+def plugin_dir(tmp_path, monkeypatch):
+    pluginDir = tmp_path.joinpath("plugins")
+    lazyPath = pluginDir.joinpath("lazyPlugin")
+    lazyPath.mkdir(parents=True)
+    lazyPath.joinpath("__init__.py").write_text(
+        "def openTool(mainW):\n    return ('opened', mainW)\n"
+    )
+    manifest = {
+        "name": "Lazy Plugin",
+        "entryPoint": "lazyPlugin",
+        "menus": [{"menu": "Tools", "text": "Open Tool", "callback": "openTool"}],
+    }
+    lazyPath.joinpath("plugin.json").write_text(json.dumps(manifest))
+    eagerPath = pluginDir.joinpath("eagerPlugin")
+    eagerPath.mkdir()
+    eagerPath.joinpath("__init__.py").write_text("value = 1\n")
+    brokenPath = pluginDir.joinpath("brokenPlugin")
+    brokenPath.mkdir()
+    brokenPath.joinpath("__init__.py").write_text("raise ImportError('broken')\n")
+    brokenPath.joinpath("plugin.json").write_text(json.dumps({"name": "Broken"}))
+    monkeypatch.syspath_prepend(str(pluginDir))
+    yield pluginDir
+    for name in ("lazyPlugin", "eagerPlugin", "brokenPlugin"):
+        sys.modules.pop(name, None)
+
+
+@pytest.fixture
+def fake_app():
+    app = SimpleNamespace(logger=logging.getLogger("test"), plugins={})
+    app._readManifest = lambda *args: revedaApp._readManifest(app, *args)
+    return app
+
+
+def test_plugin_not_imported_until_used(plugin_dir, fake_app):
+    manifest = revedaApp._readManifest(fake_app, plugin_dir, "lazyPlugin", True)
+    plugin = revedaPlugin("lazyPlugin", manifest, fake_app.logger)
+    assert not plugin.loaded
+    assert "lazyPlugin" not in sys.modules
+    assert plugin.menus[0]["callback"] == "openTool"
+    assert plugin.invoke("openTool", "mainW") == ("opened", "mainW")
+    assert plugin.loaded
+    assert "lazyPlugin" in sys.modules
+
+
+def test_plugin_attribute_access_loads_module(plugin_dir):
+    plugin = revedaPlugin("lazyPlugin", {}, logging.getLogger("test"))
+    with pytest.raises(AttributeError):
+        plugin.__file__
+    assert callable(plugin.openTool)
+    assert plugin.loaded
+    assert plugin.__name__ == "lazyPlugin"
+    assert plugin.__file__ == sys.modules["lazyPlugin"].__file__
+
+
+def test_plugin_default_activation():
+    plugin = revedaPlugin("lazyPlugin", {}, logging.getLogger("test"))
+    assert plugin.activation == ["onAction"]
+    assert plugin.entryPoint == "lazyPlugin"
+
+
+def test_readManifest(plugin_dir, fake_app):
+    manifest = revedaApp._readManifest(fake_app, plugin_dir, "lazyPlugin", True)
+    assert manifest["entryPoint"] == "lazyPlugin"
+    assert revedaApp._readManifest(fake_app, plugin_dir, "eagerPlugin", True) is None
+    plugin_dir.joinpath("badPlugin.json").write_text("{not json")
+    assert revedaApp._readManifest(fake_app, plugin_dir, "badPlugin", False) is None
+
+
+def test_discover_plugins_defers_manifest_plugins(plugin_dir, fake_app):
+    revedaApp.discover_plugins(fake_app, plugin_dir)
+    assert not fake_app.plugins["plugins.lazyPlugin"].loaded
+    assert not fake_app.plugins["plugins.brokenPlugin"].loaded
+    # plugins without a manifest are imported during discovery.
+    assert fake_app.plugins["plugins.eagerPlugin"].loaded
+    assert fake_app.plugins["plugins.eagerPlugin"].value == 1
+
+
+def test_failed_plugin_import_is_logged(plugin_dir, caplog):
+    plugin = revedaPlugin("brokenPlugin", {"name": "Broken"}, logging.getLogger("test"))
+    with caplog.at_level(logging.ERROR, logger="test"):
+        assert plugin.invoke("anything") is None
+    assert "Failed to import plugin Broken" in caplog.text
+    assert not plugin.loaded
+
+
+@pytest.mark.parametrize("content", ["[1, 2]", '"plugin"', '{"menus": {"menu": "Tools"}}'])
+def test_readManifest_rejects_wrong_shapes(plugin_dir, fake_app, content):
+    plugin_dir.joinpath("shapePlugin.json").write_text(content)
+    manifest = revedaApp._readManifest(fake_app, plugin_dir, "shapePlugin", False)
+    assert manifest is None or manifest["menus"] == []
+
+
+def test_readManifest_skips_bad_menu_entries(plugin_dir, fake_app, caplog):
+    entries = ["Tools", {"menu": "Tools"}, {"menu": "Tools", "callback": "openTool"}]
+    plugin_dir.joinpath("menuPlugin.json").write_text(json.dumps({"menus": entries}))
+    with caplog.at_level(logging.ERROR, logger="test"):
+        manifest = revedaApp._readManifest(fake_app, plugin_dir, "menuPlugin", False)
+    assert manifest["menus"] == [entries[2]]
+    assert caplog.text.count("Skipping invalid menu entry") == 2
+
+
+def test_hasattr_on_broken_plugin(plugin_dir):
+    plugin = revedaPlugin("brokenPlugin", {"name": "Broken"}, logging.getLogger("test"))
+    assert not hasattr(plugin, "openTool")
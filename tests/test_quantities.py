@@ -0,0 +1,49 @@
+import pytest
+from hypothesis import given, strategies as st
+from quantiphy import InvalidNumber, Quantity
+
+import quantityParser
+
+numberStrings = st.builds(
+    lambda sign, whole, fraction, exponent, suffix: sign + whole + fraction + exponent + suffix,
+    st.sampled_from(["", "+", "-"]),
+    st.from_regex(r"\d{0,4}", fullmatch=True),
+    st.sampled_from(["", ".", ".5", ".25", ".001"]),
+    st.sampled_from(["", "e3", "E-6", "e+2"]),
+    st.sampled_from(["", *quantityParser.SCALE_FACTORS, "F", "uF", "Ohm", " m", "meg"]),
+)
+
+
+@given(numberStrings)
+def test_parseQuantity_matches_quantiphy(text):
+    try:
+        expected = float(Quantity(text))
+    except InvalidNumber:
+        with pytest.raises(InvalidNumber):
+            quantityParser.parseQuantity(text)
+    else:
+        assert quantityParser.parseQuantity(text) == expected
+
+
+def test_quantityCacheStats_counts_hits():
+    quantityParser.clearQuantityCache()
+    for value in ["1u", "180n", "1u", "1u"]:
+        quantityParser.parseQuantity(value)
+    stats = quantityParser.quantityCacheStats()
+    assert (stats["hits"], stats["misses"]) == (2, 2)
+    assert stats["hitRate"] == 0.5
+
+
+def test_parseQuantity_accepts_numbers():
+    assert quantityParser.parseQuantity(3) == 3.0
+    assert quantityParser.parseQuantity(Quantity("2u")) == 2e-6
+
+
+def test_parseQuantity_follows_changed_preferences():
+    assert quantityParser.parseQuantity("1m") == 1e-3
+    with Quantity.prefs(known_units=["m"]):
+        assert not quantityParser.defaultQuantityPreferences()
+        # with 'm' a known unit, '1m' is one metre rather than one milli.
+        assert quantityParser.parseQuantity("1m") == float(Quantity("1m")) == 1.0
+    assert quantityParser.defaultQuantityPreferences()
+    assert quantityParser.parseQuantity("1m") == 1e-3
@@ -0,0 +1,96 @@
+import importlib
+import json
+import sys
+
+import pytest
+
+from startupProfiler import PROFILE_FLAG, startupProfiler
+
+
+def test_profiler_disabled_by_default(monkeypatch):
+    monkeypatch.delenv("REVEDA_PROFILE_STARTUP", raising=False)
+    argv = ["reveda"]
+    profiler = startupProfiler.fromArgs(argv)
+    assert not profiler.enabled
+    with profiler.phase("dotenv"):
+        pass
+    assert profiler.phases == []
+    assert profiler.writeReport() is None
+
+
+def test_profiler_records_phases_and_imports(tmp_path, monkeypatch):
+    monkeypatch.delenv("REVEDA_PROFILE_STARTUP", raising=False)
+    argv = ["reveda", PROFILE_FLAG]
+    profiler = startupProfiler.fromArgs(argv)
+    profiler.reportPath = tmp_path / "profile.json"
+    assert argv == ["reveda"]
+    try:
+        with profiler.phase("imports"):
+            sys.modules.pop("colorsys", None)
+            import colorsys  # noqa: F401
+    finally:
+        profiler.removeImportHook()
+    report = profiler.writeReport()
+    assert [phase["name"] for phase in report["phases"]] == ["imports"]
+    assert "colorsys" in [item["module"] for item in report["slowestImports"]]
+    assert json.loads(profiler.reportPath.read_text()) == report
+
+
+def test_profiler_env_report_path(monkeypatch):
+    monkeypatch.setenv("REVEDA_PROFILE_STARTUP", "startup.json")
+    profiler = startupProfiler.fromArgs(["reveda"])
+    profiler.removeImportHook()
+    assert profiler.enabled
+    assert str(profiler.reportPath) == "startup.json"
+
+
+@pytest.fixture
+def fake_pdk(tmp_path, monkeypatch):
+    pdkPath = tmp_path.joinpath("fakePdk")
+    pdkPath.mkdir()
+    pdkPath.joinpath("__init__.py").write_text("")
+    pdkPath.joinpath("layoutLayers.py").write_text(
+        "import time\ntime.sleep(0.02)\n"
+    )
+    pdkPath.joinpath("process.py").write_text(
+        "from fakePdk import layoutLayers\ndbu = 1000\n"
+    )
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield pdkPath
+    for name in ("fakePdk", "fakePdk.layoutLayers", "fakePdk.process"):
+        sys.modules.pop(name, None)
+
+
+def test_profiler_records_importlib_pdk_imports(fake_pdk, monkeypatch):
+    monkeypatch.delenv("REVEDA_PROFILE_STARTUP", raising=False)
+    profiler = startupProfiler(enabled=True)
+    profiler.installImportHook()
+    try:
+        with profiler.phase("pdkImport"):
+            importlib.import_module("fakePdk.process")
+    finally:
+        profiler.removeImportHook()
+    report = profiler.report(fake_pdk)
+    assert report["pdkImportMs"] > 0
+    modules = {item["module"]: item for item in report["slowestImports"]}
+    # the sleeping submodule, imported with "from package import module",
+    # is charged to itself and not to its importer.
+    assert modules["fakePdk.layoutLayers"]["selfMs"] >= 20
+    assert modules["fakePdk.process"]["selfMs"] < modules["fakePdk.layoutLayers"]["selfMs"]
+    assert modules["fakePdk.process"]["cumulativeMs"] >= 20
+    assert sys.modules["fakePdk.process"].__loader__.__class__.__name__ != "timedLoader"
+
+
+def test_profiler_invalid_top_imports(monkeypatch):
+    monkeypatch.delenv("REVEDA_PROFILE_STARTUP", raising=False)
+    monkeypatch.setenv("REVEDA_PROFILE_TOP", "many")
+    profiler = startupProfiler.fromArgs(["reveda"])
+    assert profiler.topImports == 25
+
+
+@pytest.mark.parametrize("value", ["0", "false", "No", "OFF", ""])
+def test_profiler_env_off_values(monkeypatch, value):
+    monkeypatch.setenv("REVEDA_PROFILE_STARTUP", value)
+    profiler = startupProfiler.fromArgs(["reveda"])
+    assert not profiler.enabled
+    assert profiler._finder is None